@@ -1,9 +1,62 @@
 import time
 
+try:
+    from time import sleep_us as _sleep_us
+
+    def _busy_wait(seconds: float) -> None:
+        _sleep_us(int(seconds * 1_000_000))
+
+except ImportError:
+    if hasattr(time, "perf_counter"):
+
+        def _busy_wait(seconds: float) -> None:
+            """Spin for short waits that time.sleep() would overshoot"""
+            deadline = time.perf_counter() + seconds
+            while time.perf_counter() < deadline:
+                pass
+
+    else:
+        _busy_wait = time.sleep
+
+
+try:
+    from ._native import _emit
+except (ImportError, SyntaxError):
+    # No micropython module, or a port built without the native emitter
+
+    def _emit(write, vals: bytes) -> None:
+        """Call write() with each byte of vals"""
+        for val in vals:
+            write(val)
+
+
+def _latin1_ord(text: str) -> bytes:
+    """One byte per character, '?' for characters outside latin-1"""
+    return bytes(c if c < 256 else 0x3F for c in map(ord, text))
+
+
+def _latin1_codec(text: str) -> bytes:
+    return text.encode("latin-1", "replace")
+
+
+# MicroPython ignores the encoding argument and always encodes to UTF-8
+_latin1 = _latin1_codec if "\xe9".encode("latin-1") == b"\xe9" else _latin1_ord
+
+
+def _translate_map(raw: bytes, charmap: bytes) -> bytes:
+    """bytes.translate() for runtimes which lack it, such as MicroPython"""
+    return bytes(charmap[b] for b in raw)
+
+
+def _translate_bytes(raw: bytes, charmap: bytes) -> bytes:
+    return raw.translate(charmap)
+
+
+_translate = _translate_bytes if hasattr(bytes, "translate") else _translate_map
+
 
 class Driver(object):
-    def __init__(self):
-        pass
+    __slots__ = ()
 
     def initialize(self) -> bool:
         """Returns True if 8-bit mode is necessary"""
@@ -12,9 +65,17 @@ class Driver(object):
     def command(self, cmd: int) -> "Driver":
         return self
 
+    def command_bulk(self, cmds: bytes) -> "Driver":
+        _emit(self.command, cmds)
+        return self
+
     def data(self, val: int) -> "Driver":
         return self
 
+    def data_bulk(self, vals: bytes) -> "Driver":
+        _emit(self.data, vals)
+        return self
+
 
 # HD44780 compatible instructions
 #
@@ -30,6 +91,9 @@ _DISPLAY_CONTROL = 0b0000_1000
 _DISPLAY_ENABLE = 0b0000_0100
 _CURSOR_SHOW = 0b0000_0010
 _CURSOR_BLINK = 0b0000_0001
+_DISPLAY_ENABLE_CLR = 0xFF ^ _DISPLAY_ENABLE
+_CURSOR_SHOW_CLR = 0xFF ^ _CURSOR_SHOW
+_CURSOR_BLINK_CLR = 0xFF ^ _CURSOR_BLINK
 # Cursor or display shift
 _CURSOR_LEFT = 0b0001_0000
 _CURSOR_RIGHT = 0b0001_0100
@@ -47,6 +111,9 @@ _CGRAM_ADDRESS = 0b0100_0000
 # Set DDRAM address
 _DDRAM_ADDRESS = 0b1000_0000
 
+# Identity character map
+_CHARMAP_IDENTITY = bytes(range(256))
+
 
 class CharLCD(object):
     """Base character LCD controller, such as HD44780 or ST7066U.
@@ -55,6 +122,23 @@ class CharLCD(object):
 
     """
 
+    __slots__ = (
+        "_driver",
+        "_columns",
+        "_lines",
+        "_ddram_base",
+        "_charmap",
+        "_display_control",
+        "_cgram_address",
+        "_ddram_address",
+        "_column",
+        "_row",
+        "_message",
+        "_column_align",
+        "_right_to_left",
+        "_function_set",
+    )
+
     def __init__(self, driver: Driver, columns: int, lines: int, row_offsets: list = None):
         """
         Args:
@@ -69,7 +153,8 @@ class CharLCD(object):
             row_offsets = [0x00, 0x40]
         if len(row_offsets) < lines:
             raise ValueError()
-        self._row_offsets = row_offsets
+        self._ddram_base = tuple(_DDRAM_ADDRESS | offset for offset in row_offsets)
+        self._charmap = _CHARMAP_IDENTITY
         self._reset()
         self._initialize()
 
@@ -82,19 +167,18 @@ class CharLCD(object):
         self._message = ""
         self._column_align = False
         self._right_to_left = False
+        self._function_set = _FUNCTION_1LINE | _FUNCTION_5X8
+        if self._lines >= 2:
+            self._function_set |= _FUNCTION_2LINE
 
     def _initialize(self) -> None:
         # Reset unknown bus state to 8bit mode
         self._driver.command(_FUNCTION_8BIT)
-        time.sleep(0.004)
+        _busy_wait(0.004)
         self._driver.command(_FUNCTION_8BIT)
-        time.sleep(0.001)
-        # Initialize internal register copy
-        self._function_set = _FUNCTION_1LINE | _FUNCTION_5X8
+        _busy_wait(0.001)
         if self._driver.initialize():
             self._function_set |= _FUNCTION_8BIT
-        if self._lines == 2:
-            self._function_set |= _FUNCTION_2LINE
         # Issue initialize commands
         self._driver.command(self._function_set)
         self.display = True
@@ -108,13 +192,13 @@ class CharLCD(object):
     def clear(self) -> "CharLCD":
         self._driver.command(_CLEAR_DISPLAY)
         self._column, self._row = 0, 0
-        time.sleep(0.002)
+        _busy_wait(0.002)
         return self
 
     def home(self) -> "CharLCD":
         self._driver.command(_RETURN_HOME)
         self._column, self._row = 0, 0
-        time.sleep(0.002)
+        _busy_wait(0.002)
         return self
 
     @property
@@ -123,14 +207,18 @@ class CharLCD(object):
 
     @right_to_left.setter
     def right_to_left(self, enable: bool) -> None:
-        self._right_to_left = bool(enable)
-        entry = _ENTRY_RIGHT if self._right_to_left else _ENTRY_LEFT
+        self._right_to_left = True if enable else False
+        entry = _ENTRY_RIGHT if enable else _ENTRY_LEFT
         self._driver.command(entry)
 
-    def _set_disply_control(self, field: int, set_reset: bool) -> int:
+    def _display_control_cmd(self, field_set: int, field_clr: int, set_reset: bool) -> int:
+        """Update the display control register copy and return its instruction"""
         mode = self._display_control
-        self._display_control = (mode | field) if set_reset else (mode & ~field)
-        self._driver.command(self._display_control)
+        self._display_control = (mode | field_set) if set_reset else (mode & field_clr)
+        return self._display_control
+
+    def _set_display_control(self, field_set: int, field_clr: int, set_reset: bool) -> None:
+        self._driver.command(self._display_control_cmd(field_set, field_clr, set_reset))
 
     @property
     def display(self) -> bool:
@@ -138,7 +226,7 @@ class CharLCD(object):
 
     @display.setter
     def display(self, enable: bool) -> None:
-        self._set_disply_control(_DISPLAY_ENABLE, enable)
+        self._set_display_control(_DISPLAY_ENABLE, _DISPLAY_ENABLE_CLR, enable)
 
     @property
     def cursor(self) -> bool:
@@ -146,15 +234,15 @@ class CharLCD(object):
 
     @cursor.setter
     def cursor(self, show: bool) -> None:
-        self._set_display_control(_CURSOR_SHOW, show)
+        self._set_display_control(_CURSOR_SHOW, _CURSOR_SHOW_CLR, show)
 
     @property
     def blink(self) -> bool:
         return bool(self._display_control & _CURSOR_BLINK)
 
     @blink.setter
-    def cursor(self, blink: bool) -> None:
-        self._set_display_control(_CURSOR_BLINK, blink)
+    def blink(self, blink: bool) -> None:
+        self._set_display_control(_CURSOR_BLINK, _CURSOR_BLINK_CLR, blink)
 
     def display_left(self) -> "CharLCD":
         self._driver.command(_DISPLAY_LEFT)
@@ -173,16 +261,9 @@ class CharLCD(object):
         return self
 
     def cursor_position(self, column: int, row: int) -> "CharLCD":
-        if column < 0:
-            column = 0
-        elif column >= self._columns:
-            column = self._columns - 1
-        if row < 0:
-            row = 0
-        elif row >= self._lines:
-            row = self._lines - 1
-        ddram_address = self._row_offsets[row] + column
-        self._driver.command(_DDRAM_ADDRESS | ddram_address)
+        column = max(0, min(column, self._columns - 1))
+        row = max(0, min(row, self._lines - 1))
+        self._driver.command(self._ddram_base[row] + column)
         return self
 
     @property
@@ -191,7 +272,19 @@ class CharLCD(object):
 
     @column_align.setter
     def column_align(self, enable: bool) -> None:
-        self._column_align = bool(enable)
+        self._column_align = True if enable else False
+
+    @property
+    def charmap(self) -> bytes:
+        """256-byte table translating latin-1 codes to display character codes"""
+        return self._charmap
+
+    @charmap.setter
+    def charmap(self, charmap: bytes) -> None:
+        if len(charmap) != 256:
+            raise ValueError("charmap must be 256 bytes")
+        charmap = bytes(charmap)
+        self._charmap = _CHARMAP_IDENTITY if charmap == _CHARMAP_IDENTITY else charmap
 
     @property
     def message(self) -> str:
@@ -200,31 +293,38 @@ class CharLCD(object):
     @message.setter
     def message(self, message: str) -> "CharLCD":
         self._message = message
+        if not message:
+            return self
+        raw = _latin1(message)
+        charmap = self._charmap
+        remap = charmap is not _CHARMAP_IDENTITY
+        data_bulk = self._driver.data_bulk
+        cursor_position = self.cursor_position
         line = self._row
-        for index, character in enumerate(message):
+        if self._right_to_left:
+            cursor_position(self._columns - self._column - 1, line)
+        first, *rest = raw.split(b"\n")
+        if first:
+            data_bulk(_translate(first, charmap) if remap else first)
+        for segment in rest:
+            line += 1
             col = self._column
-            if index == 0 and self._right_to_left:
-                col = self._columns - col - 1
-                self.cursor_position(col, line)
-            if character == "\n":
-                line += 1
-                col = self._column
-                if self._right_to_left:
-                    if not self._column_align:
-                        col = self._columns - 1
-                else:
-                    if not self._column_align:
-                        col = 0
-                self.cursor_position(col, line)
+            if self._right_to_left:
+                if not self._column_align:
+                    col = self._columns - 1
             else:
-                self._driver.data(ord(character))
+                if not self._column_align:
+                    col = 0
+            cursor_position(col, line)
+            if segment:
+                data_bulk(_translate(segment, charmap) if remap else segment)
         return self
 
     def create_character(self, code: int, dots: [int]) -> "CharLCD":
         code &= 7
         self._driver.command(_CGRAM_ADDRESS | (code << 3))
-        for i in range(8):
-            self._driver.data(dots[i])
+        self._driver.data_bulk(bytes(dots[i] & 0x1F for i in range(8)))
+        return self
 
 
 # Select instruction table
@@ -242,6 +342,8 @@ _ICON_ADDRESS = 0b0100_0000
 _POWER_SET = 0b0101_0000
 _ICON_ON = 0b0000_1000
 _BOOSTER_ON = 0b0000_0100
+_ICON_OFF = 0xFF ^ _ICON_ON
+_BOOSTER_OFF = 0xFF ^ _BOOSTER_ON
 # Follower Control
 _FOLLOWER_ON = 0b0110_1000
 _FOLLOWER_OFF = 0b0110_0000
@@ -252,40 +354,40 @@ _CONTRAST_LO = 0b0111_0000
 class ExtCharLCD(CharLCD):
     """Extended character LCD controller, such as ST7032 or ST7036"""
 
+    __slots__ = ("_bias_set", "_power_set", "_follower", "_icon_address", "_contrast")
+
     def __init__(self, driver: Driver, columns: int, lines: int, row_offsets: list = None):
         super().__init__(driver, columns, lines, row_offsets)
 
     def _reset(self) -> None:
         super()._reset()
-        self._bias_set = _BIAS_SET
-        self._power_set = 0
+        self._bias_set = _BIAS_SET | _BIAS_1_5
+        if self._lines == 3:
+            self._bias_set |= _BIAS_3LINE
+        self._power_set = _BOOSTER_ON
+        self._icon_address = 0
         self._follower = -1
 
     def _initialize(self) -> None:
         # Reset unknown bus state to 8bit mode
         self._driver.command(_FUNCTION_8BIT)
-        time.sleep(0.004)
+        _busy_wait(0.004)
         self._driver.command(_FUNCTION_8BIT)
-        time.sleep(0.001)
-        # Initialize internal register copy
-        self._function_set = _FUNCTION_1LINE | _FUNCTION_5X8
-        self._bias_set = _BIAS_SET | _BIAS_1_5
-        self._power_set = _BOOSTER_ON
-        self._icon_address = 0
+        _busy_wait(0.001)
         if self._driver.initialize():
             self._function_set |= _FUNCTION_8BIT
-        if self._lines >= 2:
-            self._function_set |= _FUNCTION_2LINE
-        if self._lines == 3:
-            self._bias_set |= _BIAS_3LINE
+        self._contrast = 0b10_0011
+        self._follower = 4
         # Issue initialize commands
-        self._driver.command(_FUNCTION_TABLE1 | self._function_set)
-        self._driver.command(self._bias_set)
-        self.contrast = 0b10_0011
-        self.follower = 4
+        self._driver.command_bulk(
+            bytes((_FUNCTION_TABLE1 | self._function_set, self._bias_set))
+            + self._contrast_cmds(self._contrast)
+            + self._follower_cmds(self._follower)
+        )
+        # Follower circuit needs to settle before the display is turned on
         time.sleep(0.200)
-        self._driver.command(_FUNCTION_TABLE0 | self._function_set)
-        self.display = True
+        display_on = self._display_control_cmd(_DISPLAY_ENABLE, _DISPLAY_ENABLE_CLR, True)
+        self._driver.command_bulk(bytes((_FUNCTION_TABLE0 | self._function_set, display_on)))
         self.clear()
         self.right_to_left = False
 
@@ -308,7 +410,7 @@ class ExtCharLCD(CharLCD):
         if enable:
             self._power_set |= _ICON_ON
         else:
-            self._power_set &= ~_ICON_ON
+            self._power_set &= _ICON_OFF
         self._driver.command(_POWER_SET | self._power_set)
 
     @property
@@ -320,7 +422,7 @@ class ExtCharLCD(CharLCD):
         if enable:
             self._power_set |= _BOOSTER_ON
         else:
-            self._power_set &= ~_BOOSTER_ON
+            self._power_set &= _BOOSTER_OFF
         self._driver.command(_POWER_SET | self._power_set)
 
     @property
@@ -329,14 +431,18 @@ class ExtCharLCD(CharLCD):
 
     @contrast.setter
     def contrast(self, contrast: int) -> None:
-        if contrast < 0:
-            contrast = 0
-        elif contrast >= 0b11_1111:
-            contrast = 0b11_1111
+        contrast = max(0, min(contrast, 0b11_1111))
         self._contrast = contrast
-        self._driver.command(_CONTRAST_LO | (contrast & 0b1111))
-        contrast >>= 4
-        self._driver.command(_POWER_SET | self._power_set | contrast)
+        self._driver.command_bulk(self._contrast_cmds(contrast))
+
+    def _contrast_cmds(self, contrast: int) -> bytes:
+        """Contrast Set and Power/ICON Control/Contrast Set instructions"""
+        return bytes(
+            (
+                _CONTRAST_LO | (contrast & 0b1111),
+                _POWER_SET | self._power_set | (contrast >> 4),
+            )
+        )
 
     @property
     def follower(self) -> int:
@@ -344,11 +450,10 @@ class ExtCharLCD(CharLCD):
 
     @follower.setter
     def follower(self, amp: int) -> None:
-        if amp < 0:
-            self._follower = -1
-            self._driver.command(_FOLLOWER_OFF)
-            return
-        elif amp >= 8:
-            amp = 7
-        self._follower = amp
-        self._driver.command(_FOLLOWER_ON | self._follower)
+        self._follower = -1 if amp < 0 else min(amp, 7)
+        self._driver.command_bulk(self._follower_cmds(self._follower))
+
+    @staticmethod
+    def _follower_cmds(amp: int) -> bytes:
+        """Follower Control instruction, turned off if amp is negative"""
+        return bytes((_FOLLOWER_OFF if amp < 0 else _FOLLOWER_ON | amp,))
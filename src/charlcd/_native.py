@@ -0,0 +1,7 @@
+import micropython
+
+
+@micropython.native
+def _emit(write, vals: bytes) -> None:
+    for val in vals:
+        write(val)
@@ -1,14 +1,28 @@
+import sys
+
 from . import Driver
 
 
 class DebugDriver(Driver):
-    def __init__(self):
-        super().__init__()
+    """Driver which logs commands and data to stdout.
+
+    A bulk call is logged with a single write to stdout.
+    """
+
+    __slots__ = ()
 
     def command(self, cmd: int) -> "Driver":
-        print("command 0x{:02x}".format(cmd))
+        sys.stdout.write(f"command 0x{cmd:02x}\n")
+        return self
+
+    def command_bulk(self, cmds: bytes) -> "Driver":
+        sys.stdout.write("".join(f"command 0x{cmd:02x}\n" for cmd in cmds))
         return self
 
     def data(self, val: int) -> "Driver":
-        print("command 0x{:02x}".format(val))
+        sys.stdout.write(f"data 0x{val:02x}\n")
+        return self
+
+    def data_bulk(self, vals: bytes) -> "Driver":
+        sys.stdout.write("".join(f"data 0x{val:02x}\n" for val in vals))
         return self
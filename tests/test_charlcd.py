@@ -0,0 +1,188 @@
+import pytest
+
+import charlcd
+from charlcd import CharLCD, Driver, ExtCharLCD
+from charlcd.debug import DebugDriver
+
+
+class RecordingDriver(Driver):
+    __slots__ = ("log", "bulks")
+
+    def __init__(self):
+        self.log = []
+        self.bulks = []
+
+    def command(self, cmd: int) -> "Driver":
+        self.log.append(("command", cmd))
+        return self
+
+    def data(self, val: int) -> "Driver":
+        self.log.append(("data", val))
+        return self
+
+    def data_bulk(self, vals: bytes) -> "Driver":
+        self.bulks.append(bytes(vals))
+        return super().data_bulk(vals)
+
+
+def commands(*cmds):
+    return [("command", cmd) for cmd in cmds]
+
+
+def data(text):
+    return [("data", val) for val in text.encode("latin-1")]
+
+
+@pytest.fixture
+def driver():
+    return RecordingDriver()
+
+
+@pytest.fixture
+def lcd(driver):
+    lcd = CharLCD(driver, 16, 2)
+    driver.log.clear()
+    return lcd
+
+
+def test_initialize(driver):
+    CharLCD(driver, 16, 2)
+    assert driver.log == commands(0x30, 0x30, 0x38, 0x0C, 0x01)
+
+
+def test_initialize_4lines(driver):
+    CharLCD(driver, 20, 4, [0x00, 0x40, 0x14, 0x54])
+    assert driver.log == commands(0x30, 0x30, 0x38, 0x0C, 0x01)
+
+
+def test_message(lcd, driver):
+    lcd.message = "ab\ncd"
+    assert lcd.message == "ab\ncd"
+    assert driver.log == data("ab") + commands(0xC0) + data("cd")
+
+
+def test_message_empty_lines(lcd, driver):
+    lcd.message = "\na\n"
+    assert driver.log == commands(0xC0) + data("a") + commands(0xC0)
+
+
+def test_message_latin1(lcd, driver):
+    lcd.message = "\u00b0\u00e9\u20ac"
+    assert driver.log == [("data", 0xB0), ("data", 0xE9), ("data", 0x3F)]
+
+
+def test_latin1_ord():
+    assert charlcd._latin1_ord("a\u00b0\u00e9\u20ac") == b"a\xb0\xe9?"
+
+
+def test_message_right_to_left(lcd, driver):
+    lcd.right_to_left = True
+    assert driver.log == commands(0x04)
+    driver.log.clear()
+    lcd.message = "ab\ncd"
+    assert driver.log == commands(0x8F) + data("ab") + commands(0xCF) + data("cd")
+
+
+def test_message_column_align(lcd, driver):
+    lcd.column_align = True
+    lcd.right_to_left = True
+    driver.log.clear()
+    lcd.message = "ab\ncd"
+    assert driver.log == commands(0x8F) + data("ab") + commands(0xC0) + data("cd")
+
+
+def test_cursor_position(lcd, driver):
+    assert lcd.cursor_position(-1, -1) is lcd
+    lcd.cursor_position(5, 1)
+    lcd.cursor_position(16, 2)
+    lcd.cursor_position(-3, 7)
+    lcd.cursor_position(20, -2)
+    assert driver.log == commands(0x80, 0xC5, 0xCF, 0xC0, 0x8F)
+
+
+def test_display_control(lcd, driver):
+    assert (lcd.display, lcd.cursor, lcd.blink) == (True, False, False)
+    lcd.cursor = True
+    lcd.blink = True
+    assert (lcd.display, lcd.cursor, lcd.blink) == (True, True, True)
+    lcd.cursor = False
+    lcd.display = False
+    assert (lcd.display, lcd.cursor, lcd.blink) == (False, False, True)
+    lcd.blink = False
+    assert driver.log == commands(0x0E, 0x0F, 0x0D, 0x09, 0x08)
+
+
+def test_create_character(lcd, driver):
+    dots = [0xFF, 0x11, 0x0A, 0x04, 0x24, 0x0A, 0x11, 0x1F]
+    assert lcd.create_character(9, dots) is lcd
+    glyph = bytes((0x1F, 0x11, 0x0A, 0x04, 0x04, 0x0A, 0x11, 0x1F))
+    assert driver.log == commands(0x40 | 1 << 3) + [("data", val) for val in glyph]
+    assert driver.bulks == [glyph]
+
+
+def test_ext_initialize(driver, monkeypatch):
+    monkeypatch.setattr(charlcd.time, "sleep", lambda seconds: None)
+    lcd = ExtCharLCD(driver, 16, 2)
+    assert driver.log == commands(
+        0x30, 0x30, 0x39, 0x14, 0x73, 0x56, 0x6C, 0x38, 0x0C, 0x01, 0x06
+    )
+    assert (lcd.contrast, lcd.follower, lcd.booster, lcd.icon) == (0b10_0011, 4, True, False)
+
+
+def test_ext_contrast_follower(driver, monkeypatch):
+    monkeypatch.setattr(charlcd.time, "sleep", lambda seconds: None)
+    lcd = ExtCharLCD(driver, 16, 2)
+    driver.log.clear()
+    lcd.contrast = 100
+    lcd.contrast = 0b01_0101
+    lcd.follower = 9
+    lcd.follower = -2
+    assert (lcd.contrast, lcd.follower) == (0b01_0101, -1)
+    assert driver.log == commands(0x7F, 0x57, 0x75, 0x55, 0x6F, 0x60)
+
+
+def test_ext_icon_booster(driver, monkeypatch):
+    monkeypatch.setattr(charlcd.time, "sleep", lambda seconds: None)
+    lcd = ExtCharLCD(driver, 16, 2)
+    lcd.contrast = 0b00_1111
+    driver.log.clear()
+    lcd.icon = True
+    assert (lcd.icon, lcd.booster) == (True, True)
+    lcd.booster = False
+    assert (lcd.icon, lcd.booster) == (True, False)
+    lcd.icon = False
+    assert (lcd.icon, lcd.booster) == (False, False)
+    lcd.booster = True
+    assert (lcd.icon, lcd.booster) == (False, True)
+    assert driver.log == commands(0x5C, 0x58, 0x50, 0x54)
+
+
+def test_charmap(lcd, driver):
+    assert lcd.charmap == bytes(range(256))
+    charmap = bytearray(range(256))
+    charmap[ord("a")] = 0x00
+    charmap[ord("\n")] = 0x20
+    lcd.charmap = charmap
+    assert lcd.charmap == bytes(charmap)
+    lcd.message = "ab\nba"
+    assert driver.log == data("\0b") + commands(0xC0) + data("b\0")
+
+
+def test_charmap_invalid(lcd):
+    with pytest.raises(ValueError):
+        lcd.charmap = bytes(255)
+    assert lcd.charmap == bytes(range(256))
+
+
+def test_translate_map():
+    charmap = bytearray(range(256))
+    charmap[ord("a")] = 0xE1
+    assert charlcd._translate_map(b"abc", bytes(charmap)) == b"\xe1bc"
+
+
+def test_debug_driver(capsys):
+    lcd = CharLCD(DebugDriver(), 16, 2)
+    capsys.readouterr()
+    lcd.message = "hi"
+    lcd.home()
+    assert capsys.readouterr().out == "data 0x68\ndata 0x69\ncommand 0x02\n"